@@ -0,0 +1,56 @@
+"""
+Ahead-of-time build of the AQI kernels (numba.pycc).
+
+    python -m airq_nyc._aqi_aot
+
+writes airq_nyc/_aqi_aot_ext*.so next to this file. aqi_calculations
+imports that extension first: it needs neither numba nor any JIT warmup at
+run time. Without it, the JIT kernels in _aqi_numba are used, and then the
+pure-NumPy path. Building requires numba and a C compiler.
+
+The exported functions have the same signatures and results as
+_aqi_numba._aqi_kernel / _fused_final_aqi, but run serially (pycc does not
+support parallel=True). Only the loops live here; the per-row logic is
+_aqi_numba's _lookup / _final_row, so a fix there reaches both builds
+(rebuild the extension afterwards).
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+from airq_nyc._aqi_numba import _final_row, _lookup
+
+cc = CC("_aqi_aot_ext")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("aqi_table", "Tuple((f8[:], i8[:]))(f8[:], f8[:], f8[:], f8[:], i4[:])")
+def aqi_table(values, clow, chigh, slope, ilow):
+    """Per-value (aqi, row) for one breakpoint table; see _aqi_numba._aqi_kernel."""
+    n = values.shape[0]
+    nb = chigh.shape[0]
+    aqi = np.empty(n, dtype=np.float64)
+    row = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        aqi[i], row[i] = _lookup(values[i], clow, chigh, slope, ilow, 0, nb)
+    return aqi, row
+
+
+@cc.export("fused_aqi",
+           "Tuple((f8[:], i8[:], i8[:]))(f8[:], f8[:], f8[:], f8[:], "
+           "f8[:], f8[:], f8[:], i4[:], i8[:], i8[:])")
+def fused_aqi(pm25, o3, no2, co, clow, chigh, slope, ilow, cat, starts):
+    """(aqi, dominant_idx, category_idx) per row; see _aqi_numba._fused_final_aqi."""
+    n = pm25.shape[0]
+    aqi = np.empty(n, dtype=np.float64)
+    dom = np.empty(n, dtype=np.int64)
+    cats = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        aqi[i], dom[i], cats[i] = _final_row(i, pm25, o3, no2, co, clow, chigh, slope, ilow, cat, starts)
+    return aqi, dom, cats
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,99 @@
+"""
+Optional Numba kernels for the vectorized AQI path.
+
+Importing this module requires numba; aqi_calculations falls back to the
+pure-NumPy implementation when it is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _band(v, chigh, lo, hi):
+    """bisect_left over chigh[lo:hi] (NaN lands on lo and fails the c_low check)."""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if chigh[mid] < v:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit(cache=True)
+def _lookup(v, clow, chigh, slope, ilow, start, end):
+    """(aqi, row) for v in the table stored at rows [start, end); (NaN, -1) if out of range."""
+    j = _band(v, chigh, start, end)
+    if j < end and clow[j] <= v:
+        return np.rint(slope[j] * (v - clow[j]) + ilow[j]), j
+    return np.nan, -1
+
+
+@njit(cache=True, inline="always")
+def _final_row(i, pm25, o3, no2, co, clow, chigh, slope, ilow, cat, starts):
+    """
+    (aqi, dominant_idx, category_idx) for row i: the highest of the four
+    sub-indices, first pollutant on ties; (NaN, -1, -1) if none applies.
+    """
+    best = np.nan
+    best_dom = -1
+    best_row = -1
+    for p in range(4):
+        if p == 0:
+            v = pm25[i]
+        elif p == 1:
+            v = o3[i]
+        elif p == 2:
+            v = no2[i]
+        else:
+            v = co[i]
+        a, r = _lookup(v, clow, chigh, slope, ilow, starts[p], starts[p + 1])
+        if r >= 0 and (best_dom < 0 or a > best):
+            best, best_dom, best_row = a, p, r
+    return best, best_dom, (cat[best_row] if best_row >= 0 else -1)
+
+
+@njit(parallel=True, cache=True)
+def _aqi_kernel(values, clow, chigh, slope, ilow):
+    """
+    Per-value AQI for one breakpoint table.
+
+    Returns (aqi, row): aqi is NaN and row is -1 where the value is missing
+    or falls outside every band.
+    """
+    n = values.shape[0]
+    nb = chigh.shape[0]
+    aqi = np.empty(n, dtype=np.float64)
+    row = np.empty(n, dtype=np.intp)
+    for i in prange(n):
+        aqi[i], row[i] = _lookup(values[i], clow, chigh, slope, ilow, 0, nb)
+    return aqi, row
+
+
+@njit(parallel=True, cache=True)
+def _fused_final_aqi(pm25, o3, no2, co, clow, chigh, slope, ilow, cat, starts):
+    """
+    Final AQI in one pass over the rows: the four sub-indices are computed and
+    the running maximum kept in registers, without materializing N x 4 blocks.
+
+    The tables are packed back to back (pm25, o3, no2, co); pollutant p's
+    table occupies rows [starts[p], starts[p + 1]).
+    Returns (aqi, dominant_idx, category_idx) with NaN / -1 / -1 for rows
+    where no pollutant gives a sub-index. Ties go to the first pollutant.
+    """
+    n = pm25.shape[0]
+    aqi = np.empty(n, dtype=np.float64)
+    dom = np.empty(n, dtype=np.intp)
+    cats = np.empty(n, dtype=np.intp)
+    for i in prange(n):
+        aqi[i], dom[i], cats[i] = _final_row(i, pm25, o3, no2, co, clow, chigh, slope, ilow, cat, starts)
+    return aqi, dom, cats
+
+
+# Compile once on import (same argument types as the real tables) so the
+# first real call does not pay the JIT latency.
+_aqi_kernel(np.zeros(1), np.zeros(1), np.ones(1), np.ones(1), np.zeros(1, dtype=np.int32))
+_fused_final_aqi(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1),
+                 np.zeros(4), np.ones(4), np.ones(4), np.zeros(4, dtype=np.int32),
+                 np.zeros(4, dtype=np.intp), np.arange(5, dtype=np.intp))
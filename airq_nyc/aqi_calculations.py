@@ -11,8 +11,19 @@ Expected units:
 - CO    : ppm   (8-hr)
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple, Optional
+from typing import Dict, Iterable, Tuple, Optional, Union
+
+import numpy as np
+
+try:  # optional: prebuilt kernels (python -m airq_nyc._aqi_aot), no JIT warmup
+    from airq_nyc._aqi_aot_ext import aqi_table as _aqi_kernel, fused_aqi as _fused_final_aqi
+except ImportError:
+    try:  # optional: JIT-compiled kernels (pip install airq-nyc[fast])
+        from airq_nyc._aqi_numba import _aqi_kernel, _fused_final_aqi
+    except ImportError:
+        _aqi_kernel = _fused_final_aqi = None
 
 
 @dataclass
@@ -26,7 +37,7 @@ class Breakpoint:
 
 # ---- EPA breakpoints ---------------------------------------------------------
 
-PM25_BP: Iterable[Breakpoint] = (
+PM25_BP: Tuple[Breakpoint, ...] = (
     Breakpoint(0.0, 12.0, 0, 50, "Good"),
     Breakpoint(12.1, 35.4, 51, 100, "Moderate"),
     Breakpoint(35.5, 55.4, 101, 150, "Unhealthy for Sensitive Groups"),
@@ -36,7 +47,7 @@ PM25_BP: Iterable[Breakpoint] = (
 )
 
 # O3 8-hour (ppm) — used up to 0.200 ppm
-O3_8HR_BP: Iterable[Breakpoint] = (
+O3_8HR_BP: Tuple[Breakpoint, ...] = (
     Breakpoint(0.000, 0.054, 0, 50, "Good"),
     Breakpoint(0.055, 0.070, 51, 100, "Moderate"),
     Breakpoint(0.071, 0.085, 101, 150, "Unhealthy for Sensitive Groups"),
@@ -46,13 +57,13 @@ O3_8HR_BP: Iterable[Breakpoint] = (
 
 # O3 1-hour (ppm) — EPA guidance: use 1-hr table when 8-hr > 0.200 ppm
 # (Ranges approximate the regulatory table used for AQI > 100)
-O3_1HR_BP: Iterable[Breakpoint] = (
+O3_1HR_BP: Tuple[Breakpoint, ...] = (
     Breakpoint(0.125, 0.164, 101, 150, "Unhealthy for Sensitive Groups"),
     Breakpoint(0.165, 0.204, 151, 200, "Unhealthy"),
     Breakpoint(0.205, 0.404, 201, 500, "Very Unhealthy/Hazardous"),
 )
 
-NO2_BP: Iterable[Breakpoint] = (
+NO2_BP: Tuple[Breakpoint, ...] = (
     Breakpoint(0, 53, 0, 50, "Good"),
     Breakpoint(54, 100, 51, 100, "Moderate"),
     Breakpoint(101, 360, 101, 150, "Unhealthy for Sensitive Groups"),
@@ -62,7 +73,7 @@ NO2_BP: Iterable[Breakpoint] = (
     Breakpoint(2050, 4049, 401, 500, "Hazardous"),
 )
 
-CO_BP: Iterable[Breakpoint] = (
+CO_BP: Tuple[Breakpoint, ...] = (
     Breakpoint(0.0, 4.4, 0, 50, "Good"),
     Breakpoint(4.5, 9.4, 51, 100, "Moderate"),
     Breakpoint(9.5, 12.4, 101, 150, "Unhealthy for Sensitive Groups"),
@@ -72,7 +83,7 @@ CO_BP: Iterable[Breakpoint] = (
     Breakpoint(40.5, 50.4, 401, 500, "Hazardous"),
 )
 
-BREAKPOINTS: Dict[str, Iterable[Breakpoint]] = {
+BREAKPOINTS: Dict[str, Tuple[Breakpoint, ...]] = {
     "pm25": PM25_BP,
     # O3 handled specially below (8-hr then 1-hr fallback)
     "no2": NO2_BP,
@@ -80,9 +91,71 @@ BREAKPOINTS: Dict[str, Iterable[Breakpoint]] = {
 }
 
 
-def _linear_index(c: float, bp: Breakpoint) -> int:
-    i = (bp.i_high - bp.i_low) / (bp.c_high - bp.c_low) * (c - bp.c_low) + bp.i_low
-    return int(round(i))
+# ---- Lookup tables (struct-of-arrays) ----------------------------------------
+# The Breakpoint tuples above are the readable listing; the hot paths use one
+# NumPy array per field instead, built once at import. 'cuts' (the c_high
+# column) and the *_list fields are plain-list copies for the scalar path, so
+# it can bisect and index without NumPy boxing.
+
+POLLUTANTS: Tuple[str, ...] = ("pm25", "o3", "no2", "co")
+
+# A pollutant reading: scalar, array of readings, or None when not measured
+Value = Optional[Union[float, np.ndarray]]
+
+_CATEGORY_LIST: Tuple[str, ...] = tuple(dict.fromkeys(
+    bp.category for table in (PM25_BP, O3_8HR_BP, O3_1HR_BP, NO2_BP, CO_BP) for bp in table
+))
+
+
+def _make_table(rows: Iterable[Breakpoint]) -> Dict[str, object]:
+    rows = tuple(rows)
+    c_low = np.array([bp.c_low for bp in rows], dtype=float)
+    c_high = np.array([bp.c_high for bp in rows], dtype=float)
+    i_low = np.array([bp.i_low for bp in rows], dtype=np.int32)
+    i_high = np.array([bp.i_high for bp in rows], dtype=np.int32)
+    slope = (i_high - i_low) / (c_high - c_low)
+    return dict(
+        c_low=c_low,
+        c_high=c_high,
+        i_low=i_low,
+        i_high=i_high,
+        # (I_hi - I_lo) / (C_hi - C_lo), so lookups need no divide. Kept in the
+        # slope * (C - C_lo) + I_lo form: folding C_lo into an intercept changes
+        # the rounding of some exact .5 cases (e.g. O3 0.076 ppm).
+        slope=slope,
+        category_idx=np.array([_CATEGORY_LIST.index(bp.category) for bp in rows], dtype=np.intp),
+        cuts=[bp.c_high for bp in rows],
+        c_low_list=[bp.c_low for bp in rows],
+        slope_list=slope.tolist(),
+        i_low_list=[bp.i_low for bp in rows],
+        category_list=[bp.category for bp in rows],
+    )
+
+
+# O3 as one table sorted by c_high: the 8-hr bands (up to 0.200 ppm) followed by
+# the 1-hr bands that reach above 0.200 ppm. A single bisect then applies the
+# EPA rule: values <= 0.200 land in an 8-hr band, values above it in a 1-hr band.
+O3_BP: Tuple[Breakpoint, ...] = O3_8HR_BP + tuple(bp for bp in O3_1HR_BP if bp.c_high > 0.200)
+
+_TABLES: Dict[str, Dict[str, object]] = {
+    "pm25": _make_table(PM25_BP),
+    "o3": _make_table(O3_BP),
+    "no2": _make_table(NO2_BP),
+    "co": _make_table(CO_BP),
+}
+
+
+# All tables back to back (POLLUTANTS order) for the fused kernel;
+# pollutant p's table is rows [starts[p], starts[p + 1])
+_PACKED: Dict[str, np.ndarray] = {
+    field: np.concatenate([_TABLES[k][field] for k in POLLUTANTS])
+    for field in ("c_low", "c_high", "slope", "i_low", "category_idx")
+}
+_PACKED_STARTS: np.ndarray = np.cumsum([0] + [len(_TABLES[k]["cuts"]) for k in POLLUTANTS]).astype(np.intp)
+
+
+def _linear_index(c: float, t: Dict[str, object], i: int) -> int:
+    return int(round(t["slope_list"][i] * (c - t["c_low_list"][i]) + t["i_low_list"][i]))
 
 
 def _validate_value(name: str, value: Optional[float]) -> float:
@@ -91,11 +164,14 @@ def _validate_value(name: str, value: Optional[float]) -> float:
     return float(value)
 
 
-def _aqi_from_table(value: float, table: Iterable[Breakpoint]) -> Tuple[int, str]:
-    for bp in table:
-        if bp.c_low <= value <= bp.c_high:
-            return _linear_index(value, bp), bp.category
-    raise ValueError("out_of_range")
+def _band_row(value: float, t: Dict[str, object]) -> int:
+    """Row of the band containing value, or -1 (also for NaN and gaps between bands)."""
+    cuts = t["cuts"]
+    i = bisect_left(cuts, value)
+    # "not <=" rather than ">" so NaN is rejected too
+    if i == len(cuts) or not t["c_low_list"][i] <= value:
+        return -1
+    return i
 
 
 def aqi_for_pollutant(pollutant: str, value: float) -> Tuple[int, str]:
@@ -106,56 +182,130 @@ def aqi_for_pollutant(pollutant: str, value: float) -> Tuple[int, str]:
     """
     key = pollutant.lower()
     v = _validate_value(key, value)
+    if key not in _TABLES:
+        raise ValueError(f"Unknown pollutant: {pollutant}")
+
+    t = _TABLES[key]
+    i = _band_row(v, t)
+    if i >= 0:
+        return _linear_index(v, t, i), t["category_list"][i]
 
     if key == "o3":
-        # First try 8-hr table
-        try:
-            return _aqi_from_table(v, O3_8HR_BP)
-        except ValueError:
-            # If out of 8-hr range and value is plausible, try 1-hr table
-            if v <= 0 or v > 1.0:
-                # Completely implausible daily 8-hr ppm → surface a clear error
-                raise ValueError(f"Value {v} ppm is implausible for O3 daily average; check units.")
-            try:
-                return _aqi_from_table(v, O3_1HR_BP)
-            except ValueError:
-                raise ValueError(f"Value {v} out of range for O3 (even 1-hr). Check units.")
-    else:
-        if key not in BREAKPOINTS:
-            raise ValueError(f"Unknown pollutant: {pollutant}")
-        return _aqi_from_table(v, BREAKPOINTS[key])
-
-
-def final_aqi(pm25: Optional[float] = None,
-              o3: Optional[float] = None,
-              no2: Optional[float] = None,
-              co: Optional[float] = None) -> Dict[str, object]:
+        if v <= 0 or v > 1.0:
+            # Completely implausible daily 8-hr ppm → surface a clear error
+            raise ValueError(f"Value {v} ppm is implausible for O3 daily average; check units.")
+        raise ValueError(f"Value {v} out of range for O3 (even 1-hr). Check units.")
+    raise ValueError("out_of_range")
+
+
+def _aqi_vector_table(values: np.ndarray, t: Dict[str, object]) -> Tuple[np.ndarray, np.ndarray]:
+    if _aqi_kernel is not None:
+        # writable + contiguous: a read-only input would compile a second specialization
+        values = np.require(values, dtype=np.float64, requirements="CW")
+        aqi, row = _aqi_kernel(values, t["c_low"], t["c_high"], t["slope"], t["i_low"])
+        return aqi, np.where(row >= 0, t["category_idx"][row], -1)
+
+    chigh = t["c_high"]
+    idx = np.searchsorted(chigh, values, side="left")
+    idx = np.clip(idx, 0, len(chigh) - 1)
+    lo, hi = t["c_low"][idx], chigh[idx]
+    aqi = np.rint(t["slope"][idx] * (values - lo) + t["i_low"][idx])
+    ok = (values >= lo) & (values <= hi)   # False for NaN and for gaps between bands
+    return np.where(ok, aqi, np.nan), np.where(ok, t["category_idx"][idx], -1)
+
+
+def aqi_vector(pollutant: str, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute the overall AQI given any subset of pollutants.
-    Picks the highest sub-index as the final AQI.
+    Vectorized AQI for a whole column of one pollutant.
 
-    Returns dict with keys: 'aqi', 'dominant', 'category'.
+    Returns (aqi, category_idx):
+      - aqi          : float array, NaN where the value is missing or out of range
+      - category_idx : int array indexing _CATEGORY_LIST, -1 where aqi is NaN
+
+    Same O3 rule as aqi_for_pollutant (8-hr bands up to 0.200 ppm, 1-hr bands
+    above), via the combined O3_BP table.
     """
-    results = []
+    key = pollutant.lower()
+    if key not in _TABLES:
+        raise ValueError(f"Unknown pollutant: {pollutant}")
+    return _aqi_vector_table(np.asarray(values, dtype=float), _TABLES[key])
+
 
-    if pm25 is not None:
-        a, cat = aqi_for_pollutant("pm25", pm25)
-        results.append(("pm25", a, cat))
+def _sub_indices(values: Tuple[Value, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, 4) blocks of sub-AQIs and category indices, in POLLUTANTS order."""
+    arrays = [None if v is None else np.atleast_1d(np.asarray(v, dtype=float)) for v in values]
+    n = max((len(v) for v in arrays if v is not None), default=0)
+    subs = np.full((n, len(POLLUTANTS)), np.nan)
+    cats = np.full((n, len(POLLUTANTS)), -1, dtype=np.intp)
+    for j, (name, v) in enumerate(zip(POLLUTANTS, arrays)):
+        if v is not None:
+            subs[:, j], cats[:, j] = aqi_vector(name, np.broadcast_to(v, (n,)))
+    return subs, cats
 
-    if o3 is not None:
-        a, cat = aqi_for_pollutant("o3", o3)
-        results.append(("o3", a, cat))
 
-    if no2 is not None:
-        a, cat = aqi_for_pollutant("no2", no2)
-        results.append(("no2", a, cat))
+def _dominant(subs: np.ndarray, cats: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    valid = ~np.isnan(subs).all(axis=1)
+    dom = np.full(len(subs), -1, dtype=np.intp)
+    dom[valid] = np.nanargmax(subs[valid], axis=1)   # first max wins ties
+    rows = np.arange(len(subs))
+    aqi = np.where(valid, subs[rows, dom], np.nan)
+    cat = np.where(valid, cats[rows, dom], -1)
+    return aqi, dom, cat
 
-    if co is not None:
-        a, cat = aqi_for_pollutant("co", co)
-        results.append(("co", a, cat))
 
-    if not results:
-        raise ValueError("No pollutant values provided")
+def final_aqi_vector(pm25: Value = None, o3: Value = None,
+                     no2: Value = None, co: Value = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Final AQI over aligned arrays of pollutant values (None = not measured).
+
+    Returns (aqi, dominant_idx, category_idx):
+      - aqi          : float array, NaN where no pollutant gives a sub-index
+      - dominant_idx : index into POLLUTANTS, -1 where aqi is NaN
+      - category_idx : index into _CATEGORY_LIST, -1 where aqi is NaN
+    """
+    values = (pm25, o3, no2, co)
+    if _fused_final_aqi is not None:
+        arrays = [None if v is None else np.atleast_1d(np.asarray(v, dtype=float)) for v in values]
+        n = max((len(v) for v in arrays if v is not None), default=0)
+        # writable copies where needed (broadcast views and pandas 3 arrays are read-only),
+        # so the kernel reuses the signature compiled at import
+        cols = [np.full(n, np.nan) if v is None
+                else np.require(np.broadcast_to(v, (n,)), dtype=np.float64, requirements="CW")
+                for v in arrays]
+        return _fused_final_aqi(*cols, _PACKED["c_low"], _PACKED["c_high"], _PACKED["slope"],
+                                _PACKED["i_low"], _PACKED["category_idx"], _PACKED_STARTS)
+    return _dominant(*_sub_indices(values))
+
+
+def final_aqi(pm25: Value = None,
+              o3: Value = None,
+              no2: Value = None,
+              co: Value = None) -> Dict[str, object]:
+    """
+    Compute the overall AQI given any subset of pollutants.
+    Picks the highest sub-index as the final AQI.
+
+    Returns dict with keys: 'aqi', 'dominant', 'category'.
+
+    Scalars give scalars (and a ValueError for a value outside every band).
+    Arrays give arrays: 'aqi' as float with NaN, 'dominant'/'category' as
+    object arrays with None, for rows without a usable value.
+    """
+    values = (pm25, o3, no2, co)
+    # isinstance first: np.ndim costs more than a whole scalar lookup
+    if all(v is None or isinstance(v, (float, int)) or np.ndim(v) == 0 for v in values):
+        # Scalar fast path: plain bisect lookups, no array round trip
+        best = None
+        for name, v in zip(POLLUTANTS, values):
+            if v is not None:
+                a, cat = aqi_for_pollutant(name, v)
+                if best is None or a > best[0]:   # first max wins ties
+                    best = (a, name, cat)
+        if best is None:
+            raise ValueError("No pollutant values provided")
+        return {"aqi": best[0], "dominant": best[1], "category": best[2]}
 
-    dominant = max(results, key=lambda r: r[1])
-    return {"aqi": dominant[1], "dominant": dominant[0], "category": dominant[2]}
+    aqi, dom, cat = final_aqi_vector(*values)
+    names = np.array(POLLUTANTS + (None,), dtype=object)        # index -1 -> None
+    categories = np.array(_CATEGORY_LIST + (None,), dtype=object)
+    return {"aqi": aqi, "dominant": names[dom], "category": categories[cat]}
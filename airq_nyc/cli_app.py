@@ -22,20 +22,27 @@ Safety feature:
   defaults using files under the repo's data/ folder, so it "just works".
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Tuple
 import argparse
+import importlib.util
 import logging
 import sys
 
+import pandas as pd
+
 from airq_nyc.data_io import read_pollutants_csv, read_epa_aqi_csv
 from airq_nyc.data_analysis import (
     compute_aqi_from_pollutants,
     compare_to_epa,
     aggregate_trend,
+    prepare_compare,
     aggregate_compare,
     daily_ratio,
 )
 from airq_nyc.visualization_mpl import (
+    new_axes,
     plot_daily_comparison,
     plot_monthly_comparison,
     plot_yearly_comparison,
@@ -93,6 +100,67 @@ def _maybe_autofill_argv_if_empty() -> None:
     sys.argv = argv
 
 
+def _plot_tasks(cmpdf, tr, trend) -> List[Tuple[str, Callable, pd.DataFrame, str]]:
+    """
+    Build (label, plot_fn, frame, path) for each PNG. The aggregates are
+    computed here, so workers only receive small plot-ready frames.
+    """
+    tasks = []
+    # 5a) If we have EPA comparison, produce classic comparison figures + scatter
+    if cmpdf is not None:
+        # date-indexed view shared by the three aggregates below
+        prepped = prepare_compare(cmpdf)
+        aggregates = [
+            ("daily comparison plot", plot_daily_comparison, "results/aqi_daily_comparison.png",
+             lambda: daily_ratio(cmpdf, prepared=prepped)),
+            ("monthly comparison plot", plot_monthly_comparison, "results/aqi_monthly_lines.png",
+             lambda: aggregate_compare(cmpdf, freq="ME", prepared=prepped)),
+            ("yearly comparison plot", plot_yearly_comparison, "results/aqi_yearly_bars.png",
+             lambda: aggregate_compare(cmpdf, freq="YE", prepared=prepped)),
+        ]
+        for label, fn, path, make in aggregates:
+            try:
+                tasks.append((label, fn, make(), path))
+            except Exception as e:
+                logging.warning("%s skipped: %s", label, e)
+
+        # EPA vs Computed scatter (only the two plotted columns are shipped)
+        tasks.append(("EPA vs Computed scatter", plot_epa_vs_computed,
+                      cmpdf[["aqi_epa", "aqi_computed"]], "results/aqi_epa_scatter.png"))
+
+    # 5b) Monthly AQI trend (from computed AQI only)
+    if tr is not None and (trend in ("M", "ME")):
+        tasks.append(("monthly trend plot", plot_monthly_trend, tr, "results/aqi_trend.png"))
+    return tasks
+
+
+def _write_plots(cmpdf, tr, trend, jobs: int = 1) -> None:
+    """
+    Write the PNG plots. By default they are drawn in-process on one reused
+    Figure; jobs > 1 renders them in that many worker processes instead.
+    Workers only pay off where they start cheaply (fork): under spawn each
+    one re-imports pandas/matplotlib, which costs more than a plot.
+    """
+    tasks = _plot_tasks(cmpdf, tr, trend)
+    workers = min(jobs, len(tasks))
+    if workers <= 1:
+        ax = new_axes()
+        for label, fn, df, path in tasks:
+            try:
+                fn(df, path, ax=ax)
+            except Exception as e:
+                logging.warning("%s skipped: %s", label, e)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [(label, ex.submit(fn, df, path)) for label, fn, df, path in tasks]
+        for label, f in futures:
+            try:
+                f.result()
+            except Exception as e:
+                logging.warning("%s skipped: %s", label, e)
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -101,14 +169,20 @@ def main() -> None:
     p = argparse.ArgumentParser(description="Compute and analyze NYC AQI.")
     p.add_argument("--raw", required=True, help="CSV with columns: date, pm25, o3, no2, co")
     p.add_argument("--epa", help="Official AQI (EPA) CSV with columns: date, aqi")
-    p.add_argument("--out", default="results/aqi_computed.csv", help="Output CSV for computed AQI")
+    p.add_argument("--out", default="results/aqi_computed.csv",
+                   help="Output CSV for computed AQI (a .parquet path writes Parquet instead)")
     p.add_argument("--compare-out", default="results/aqi_compare.csv",
                    help="Output CSV for computed vs official comparison (requires --epa)")
     p.add_argument("--trend", choices=["D", "ME", "YE"],
                    help="Also write aggregated trend CSV at the given frequency")
     p.add_argument("--plots", action="store_true",
                    help="Generate Matplotlib PNG plots in results/")
+    p.add_argument("--jobs", type=int, default=1,
+                   help="Worker processes for --plots (default 1: render in-process)")
     args = p.parse_args()
+    if args.out.endswith(".parquet") and not any(
+            importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+        p.error("--out *.parquet needs pyarrow or fastparquet (pip install airq-nyc[parquet])")
 
     # Resolve relative paths against current working directory (usually repo root)
     Path("results").mkdir(exist_ok=True, parents=True)
@@ -120,7 +194,10 @@ def main() -> None:
     # 2) Compute per-day AQI
     logging.info("computing AQI per day")
     df_comp = compute_aqi_from_pollutants(df_raw)
-    df_comp.to_csv(args.out, index=False)
+    if args.out.endswith(".parquet"):
+        df_comp.to_parquet(args.out, index=False)
+    else:
+        df_comp.to_csv(args.out, index=False)
     logging.info("wrote %s", args.out)
 
     # 3) Optional: Official EPA comparison
@@ -148,42 +225,7 @@ def main() -> None:
     # 5) Optional: Matplotlib plots (PNG)
     if args.plots:
         logging.info("generating plots into results/")
-
-        # 5a) If we have EPA comparison, produce classic comparison figures + scatter
-        if cmpdf is not None:
-            # daily ratio plot
-            try:
-                daily = daily_ratio(cmpdf)
-                plot_daily_comparison(daily, "results/aqi_daily_comparison.png")
-            except Exception as e:
-                logging.warning("daily comparison plot skipped: %s", e)
-
-            # monthly comparison plot
-            try:
-                month = aggregate_compare(cmpdf, freq="ME")
-                plot_monthly_comparison(month, "results/aqi_monthly_lines.png")
-            except Exception as e:
-                logging.warning("monthly comparison plot skipped: %s", e)
-
-            # yearly comparison plot
-            try:
-                year = aggregate_compare(cmpdf, freq="YE")
-                plot_yearly_comparison(year, "results/aqi_yearly_bars.png")
-            except Exception as e:
-                logging.warning("yearly comparison plot skipped: %s", e)
-
-            # EPA vs Computed scatter
-            try:
-                plot_epa_vs_computed(cmpdf, "results/aqi_epa_scatter.png")
-            except Exception as e:
-                logging.warning("EPA vs Computed scatter skipped: %s", e)
-
-        # 5b) Monthly AQI trend (from computed AQI only)
-        if tr is not None and (args.trend in ("M", "ME")):
-            try:
-                plot_monthly_trend(tr, "results/aqi_trend.png")
-            except Exception as e:
-                logging.warning("monthly trend plot skipped: %s", e)
+        _write_plots(cmpdf, tr, args.trend, jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -18,50 +18,87 @@ We auto-normalize O3 when source units look like ppb or µg/m³:
 We choose the conversion that yields a realistic 95th percentile ≤ ~0.404 ppm.
 """
 
-from typing import Iterable
+from typing import Dict, Iterable, Optional
 import logging
+import numpy as np
 import pandas as pd
 
 
+def _normalize_name(c: object) -> str:
+    return str(c).strip().lower().replace(" ", "_")
+
+
+# The underscore helpers below modify `df` in place and return it for chaining.
+# They are only called on frames the readers just built with pd.read_csv, so
+# no defensive copies are needed.
+
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = [_normalize_name(c) for c in df.columns]
     return df
 
 
 def _to_numeric(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
-    df = df.copy()
+    """Coerce columns to numbers; columns the CSV parser already typed are skipped."""
     for c in cols:
-        if c in df:
+        if c in df and not pd.api.types.is_numeric_dtype(df[c]):
             df[c] = pd.to_numeric(df[c], errors="coerce")
     return df
 
 
+def _sniff_header(path: str) -> Dict[str, str]:
+    """Read only the CSV header and map normalized column names to raw ones."""
+    header = pd.read_csv(path, nrows=0, skipinitialspace=True).columns
+    return {_normalize_name(c): c for c in header}
+
+
+def _find_column(header: Dict[str, str], candidates: Iterable[str]) -> Optional[str]:
+    """Raw name of the first candidate present in the sniffed header, else None."""
+    for name in candidates:
+        if name in header:
+            return header[name]
+    return None
+
+
+def _parse_date_column(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+    """Rename the raw date column to 'date'; only re-parse if read_csv could not."""
+    df.rename(columns={_normalize_name(date_col): "date"}, inplace=True)
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
+def _p95(a: np.ndarray) -> float:
+    """
+    95th percentile with the same linear interpolation as Series.quantile,
+    via O(N) selection (np.partition) instead of a full sort.
+    """
+    pos = 0.95 * (len(a) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(a) - 1)
+    part = np.partition(a, [lo, hi])
+    return float(part[lo] + (part[hi] - part[lo]) * (pos - lo))
+
+
 def _choose_o3_conversion(series: pd.Series) -> str:
     """
     Decide how to treat O3 series originally not in ppm.
     Returns one of: 'ppb', 'ugm3', 'none'
     """
-    s = series.dropna()
-    if s.empty:
+    s = series.dropna().to_numpy(dtype=float)
+    if s.size == 0:
         return "none"
 
-    # Candidate conversions
-    ppm_ppb = s / 1000.0          # ppb -> ppm
-    ppm_ugm3 = s / 1960.0         # µg/m³ -> ppm (approx @ 25°C, 1 atm)
-
-    # Heuristic: prefer the option that yields a realistic upper-tail (<= 0.404 ppm)
-    p95_ppb = ppm_ppb.quantile(0.95)
-    p95_ugm3 = ppm_ugm3.quantile(0.95)
+    # Dividing by a positive factor keeps order, so one p95 serves all candidates
+    p95 = _p95(s)
 
     # If raw already seems ppm (p95 <= 0.404), keep as-is
-    if s.quantile(0.95) <= 0.404:
+    if p95 <= 0.404:
         return "none"
 
-    # Prefer the first candidate that looks reasonable
-    if p95_ppb <= 0.404:
+    # Prefer the first candidate that yields a realistic upper-tail (<= 0.404 ppm)
+    if p95 / 1000.0 <= 0.404:     # ppb -> ppm
         return "ppb"
-    if p95_ugm3 <= 0.404:
+    if p95 / 1960.0 <= 0.404:     # µg/m³ -> ppm (approx @ 25°C, 1 atm)
         return "ugm3"
 
     # Neither looks sane -> leave as-is; AQI layer will still guard with 1-hr fallback / errors
@@ -69,7 +106,6 @@ def _choose_o3_conversion(series: pd.Series) -> str:
 
 
 def _normalize_o3(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
     if "o3" not in df:
         return df
 
@@ -99,18 +135,16 @@ def read_pollutants_csv(path: str) -> pd.DataFrame:
       - pollutant columns as float (NaN allowed)
       - O3 normalized to ppm if needed
     """
-    df = pd.read_csv(path)
-    df = _normalize_columns(df)
-
-    if "date" not in df:
-        for alt in ("day", "timestamp", "date_local"):
-            if alt in df:
-                df = df.rename(columns={alt: "date"})
-                break
-    if "date" not in df:
+    header = _sniff_header(path)
+    date_col = _find_column(header, ("date", "day", "timestamp", "date_local"))
+    if date_col is None:
         raise ValueError("Input CSV must contain 'date' (or 'day'/'timestamp'/'date_local').")
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # One pass: dates and (space-padded) numbers are typed by the C parser
+    df = pd.read_csv(path, skipinitialspace=True, parse_dates=[date_col])
+    df = _normalize_columns(df)
+
+    df = _parse_date_column(df, date_col)
     if df["date"].isna().any():
         raise ValueError("Some 'date' values could not be parsed to datetime.")
 
@@ -130,24 +164,23 @@ def read_epa_aqi_csv(path: str) -> pd.DataFrame:
       - date : datetime64[ns]
       - aqi  : integer/float
     """
-    df = pd.read_csv(path)
-    df = _normalize_columns(df)
-
-    if "date" not in df:
-        for alt in ("day", "date_local", "timestamp"):
-            if alt in df:
-                df = df.rename(columns={alt: "date"})
-                break
-    if "date" not in df:
+    header = _sniff_header(path)
+    date_col = _find_column(header, ("date", "day", "date_local", "timestamp"))
+    if date_col is None:
         raise ValueError("EPA CSV must contain 'date' (or 'day'/'date_local'/'timestamp').")
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    aqi_col = _find_column(header, ("aqi",))
+    if aqi_col is None:
+        raise ValueError("EPA CSV must contain an 'aqi' column.")
+
+    # Only the two columns we keep are parsed
+    df = pd.read_csv(path, skipinitialspace=True, usecols=[date_col, aqi_col], parse_dates=[date_col])
+    df = _normalize_columns(df)
+
+    df = _parse_date_column(df, date_col)
     if df["date"].isna().any():
         raise ValueError("Some 'date' values in EPA CSV could not be parsed.")
 
-    if "aqi" not in df:
-        raise ValueError("EPA CSV must contain an 'aqi' column.")
-
-    df["aqi"] = pd.to_numeric(df["aqi"], errors="coerce")
+    df = _to_numeric(df, ["aqi"])
 
     return df[["date", "aqi"]].sort_values("date").reset_index(drop=True)
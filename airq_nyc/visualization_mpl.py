@@ -4,61 +4,105 @@ Matplotlib visualizations for AQI analysis.
 Note:
 - These functions *only* visualize (no preprocessing).
 - They expect DataFrames already prepared by data_analysis.py.
+- Each accepts an optional `ax` so a caller can reuse one Figure for several
+  plots (the Axes is cleared first); without it a new Figure is created.
+- Figures are plain matplotlib.figure.Figure objects on an Agg canvas, never
+  registered with pyplot: the active backend (e.g. Spyder's inline one) and
+  rcParams are left alone; the render settings below only apply inside each
+  plot call.
 """
 
-import matplotlib.pyplot as plt
+from typing import Optional, Tuple
+
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 
+# Faster rendering of long daily line series. Applied per plot function (not
+# just around savefig): Line2D paths read the simplify settings when created.
+_render_rc = matplotlib.rc_context({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
+
+
+def new_axes(figsize: Optional[Tuple[float, float]] = None) -> Axes:
+    """Axes on a fresh Agg-backed Figure (outside pyplot, so nothing to close)."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig.subplots()
+
+
+def _axes(ax: Optional[Axes], figsize: Tuple[float, float]):
+    """
+    Return (fig, ax). With ax=None a new figure is created; otherwise the
+    given Axes is cleared and its figure resized for reuse.
+    """
+    if ax is None:
+        ax = new_axes(figsize)
+        return ax.figure, ax
+    ax.clear()
+    fig = ax.figure
+    fig.set_size_inches(figsize)
+    return fig, ax
+
+
+def _save(fig, out: str) -> None:
+    fig.tight_layout()
+    fig.savefig(out, dpi=100)  # fixed preview resolution, whatever savefig.dpi says
+
 
 # ---------------------------------------------------------------------------
 # 1. Daily AQI Comparison with Ratio
 # ---------------------------------------------------------------------------
-def plot_daily_comparison(df: pd.DataFrame, out: str):
+@_render_rc
+def plot_daily_comparison(df: pd.DataFrame, out: str, ax: Optional[Axes] = None):
     """
     Plot computed AQI vs EPA official AQI with daily ratio.
     Expects columns: date, Computed_AQI, AQI, AQI_Ratio
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _axes(ax, (12, 6))
     ax.plot(df["date"], df["Computed_AQI"], label="Computed AQI", alpha=0.7)
     ax.plot(df["date"], df["AQI"], label="Official AQI (EPA)", alpha=0.7)
     ax.plot(df["date"], df["AQI_Ratio"], label="AQI Ratio (Computed / Official)", linestyle="--")
     ax.set_title("Daily AQI Comparison with Ratio")
     ax.set_xlabel("Date"); ax.set_ylabel("AQI / Ratio")
     ax.legend()
-    fig.tight_layout()
-    fig.savefig(out)
-    plt.close(fig)
+    _save(fig, out)
 
 
 # ---------------------------------------------------------------------------
 # 2. Monthly Average AQI Comparison
 # ---------------------------------------------------------------------------
-def plot_monthly_comparison(df: pd.DataFrame, out: str):
+@_render_rc
+def plot_monthly_comparison(df: pd.DataFrame, out: str, ax: Optional[Axes] = None):
     """
     Line plot of monthly mean Computed AQI vs EPA AQI and ratio.
     Expects columns: date, Computed_AQI, AQI, AQI_Ratio
     """
-    fig, ax = plt.subplots(figsize=(12, 5))
+    fig, ax = _axes(ax, (12, 5))
     ax.plot(df["date"], df["Computed_AQI"], label="Computed_AQI")
     ax.plot(df["date"], df["AQI"], label="Official AQI (EPA)")
     ax.plot(df["date"], df["AQI_Ratio"], label="AQI_Ratio")
     ax.set_title("Monthly Average AQI (Computed, Official, Ratio)")
     ax.set_xlabel("Month"); ax.set_ylabel("AQI / Ratio")
     ax.legend()
-    fig.tight_layout()
-    fig.savefig(out)
-    plt.close(fig)
+    _save(fig, out)
 
 
 # ---------------------------------------------------------------------------
 # 3. Yearly Average AQI Comparison
 # ---------------------------------------------------------------------------
-def plot_yearly_comparison(df: pd.DataFrame, out: str):
+@_render_rc
+def plot_yearly_comparison(df: pd.DataFrame, out: str, ax: Optional[Axes] = None):
     """
     Bar chart of yearly mean Computed AQI vs EPA AQI and ratio.
     Expects columns: date, Computed_AQI, AQI, AQI_Ratio
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = _axes(ax, (10, 5))
     years = df["date"].dt.year
     ax.bar(years - 0.2, df["Computed_AQI"], width=0.3, label="Computed_AQI")
     ax.bar(years + 0.2, df["AQI"], width=0.3, label="Official AQI (EPA)")
@@ -66,15 +110,14 @@ def plot_yearly_comparison(df: pd.DataFrame, out: str):
     ax.set_title("Yearly Average AQI (Computed, Official, Ratio)")
     ax.set_xlabel("Year"); ax.set_ylabel("AQI / Ratio")
     ax.legend()
-    fig.tight_layout()
-    fig.savefig(out)
-    plt.close(fig)
+    _save(fig, out)
 
 
 # ---------------------------------------------------------------------------
 # 4. EPA vs Computed AQI Scatter
 # ---------------------------------------------------------------------------
-def plot_epa_vs_computed(df: pd.DataFrame, out: str):
+@_render_rc
+def plot_epa_vs_computed(df: pd.DataFrame, out: str, ax: Optional[Axes] = None):
     """
     Scatter plot of Computed AQI vs Official AQI (EPA).
     Expects columns: aqi_computed, aqi_epa
@@ -82,8 +125,9 @@ def plot_epa_vs_computed(df: pd.DataFrame, out: str):
     if not {"aqi_computed", "aqi_epa"}.issubset(df.columns):
         raise ValueError("df must have columns: aqi_computed, aqi_epa")
 
-    fig, ax = plt.subplots(figsize=(6, 6))
-    ax.scatter(df["aqi_epa"], df["aqi_computed"], alpha=0.4)
+    fig, ax = _axes(ax, (6, 6))
+    # Markers-only Line2D instead of ax.scatter: one path, no PathCollection
+    ax.plot(df["aqi_epa"], df["aqi_computed"], "o", ms=6, alpha=0.4)
     lims = [
         min(df["aqi_epa"].min(), df["aqi_computed"].min()),
         max(df["aqi_epa"].max(), df["aqi_computed"].max())
@@ -91,15 +135,14 @@ def plot_epa_vs_computed(df: pd.DataFrame, out: str):
     ax.plot(lims, lims, "b-", alpha=0.7)  # 1:1 line
     ax.set_title("EPA vs Computed AQI")
     ax.set_xlabel("EPA AQI"); ax.set_ylabel("Computed AQI")
-    fig.tight_layout()
-    fig.savefig(out)
-    plt.close(fig)
+    _save(fig, out)
 
 
 # ---------------------------------------------------------------------------
 # 5. Monthly AQI Trend (overall)
 # ---------------------------------------------------------------------------
-def plot_monthly_trend(df: pd.DataFrame, out: str):
+@_render_rc
+def plot_monthly_trend(df: pd.DataFrame, out: str, ax: Optional[Axes] = None):
     """
     Simple trend of mean AQI by month.
     Expects columns: date, aqi_mean
@@ -107,10 +150,8 @@ def plot_monthly_trend(df: pd.DataFrame, out: str):
     if not {"date", "aqi_mean"}.issubset(df.columns):
         raise ValueError("df must have columns: date, aqi_mean")
 
-    fig, ax = plt.subplots(figsize=(12, 5))
+    fig, ax = _axes(ax, (12, 5))
     ax.plot(df["date"], df["aqi_mean"])
     ax.set_title("AQI Trend - Monthly (month-end)")
     ax.set_xlabel("Date"); ax.set_ylabel("Mean AQI")
-    fig.tight_layout()
-    fig.savefig(out)
-    plt.close(fig)
+    _save(fig, out)
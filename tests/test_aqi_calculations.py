@@ -1,4 +1,8 @@
-from airq_nyc.aqi_calculations import aqi_for_pollutant, final_aqi
+import numpy as np
+import pytest
+
+from airq_nyc import aqi_calculations as ac
+from airq_nyc.aqi_calculations import aqi_for_pollutant, aqi_vector, final_aqi, _CATEGORY_LIST
 
 def test_pm25_mid_band():
     aqi, cat = aqi_for_pollutant("pm25", 20.0)
@@ -8,3 +12,65 @@ def test_pm25_mid_band():
 def test_final_dominant_key_exists():
     out = final_aqi(pm25=10, o3=None, no2=None, co=None)
     assert "aqi" in out and "dominant" in out and "category" in out
+
+def test_aqi_vector_matches_scalar():
+    values = np.array([5.0, 20.0, 60.0, 12.05, np.nan])
+    aqi, cat = aqi_vector("pm25", values)
+    for v, a, c in zip(values[:3], aqi[:3], cat[:3]):
+        assert (int(a), _CATEGORY_LIST[c]) == aqi_for_pollutant("pm25", v)
+    # gap between bands and missing values -> NaN / -1
+    assert np.isnan(aqi[3]) and np.isnan(aqi[4])
+    assert cat[3] == -1 and cat[4] == -1
+
+def test_final_aqi_accepts_arrays():
+    out = final_aqi(pm25=np.array([10.0, np.nan, 60.0]), no2=np.array([70.0, np.nan, 1.0]))
+    assert out["dominant"].tolist() == ["no2", None, "pm25"]
+    assert out["aqi"][0] == final_aqi(pm25=10.0, no2=70.0)["aqi"]
+    assert np.isnan(out["aqi"][1]) and out["category"][1] is None
+
+def _mixed_columns():
+    # random values plus NaN, band gaps (pm25 12.05, no2 53.5, co 4.45) and out-of-range values
+    rng = np.random.default_rng(1)
+    cols = [rng.uniform(0, hi, 200) for hi in (300.0, 0.4, 800.0, 40.0)]
+    cols[0][::7] = np.nan
+    cols[1][::5] = np.nan
+    cols[0][3], cols[2][3], cols[3][3] = 12.05, 53.5, 4.45
+    cols[1][4], cols[2][4] = 0.5, 5000.0
+    return cols
+
+def test_aot_kernel_matches_numpy(monkeypatch):
+    ext = pytest.importorskip("airq_nyc._aqi_aot_ext")
+    cols = _mixed_columns()
+    monkeypatch.setattr(ac, "_aqi_kernel", ext.aqi_table)
+    aot_subs = [aqi_vector(name, v) for name, v in zip(ac.POLLUTANTS, cols)]
+    monkeypatch.setattr(ac, "_aqi_kernel", None)
+    for name, v, (aqi, cat) in zip(ac.POLLUTANTS, cols, aot_subs):
+        want_aqi, want_cat = aqi_vector(name, v)
+        np.testing.assert_array_equal(aqi, want_aqi)
+        np.testing.assert_array_equal(cat, want_cat)
+    p = ac._PACKED
+    got = ext.fused_aqi(*cols, p["c_low"], p["c_high"], p["slope"], p["i_low"],
+                        p["category_idx"], ac._PACKED_STARTS)
+    want = ac._dominant(*ac._sub_indices(cols))
+    np.testing.assert_array_equal(got[0], want[0])
+    np.testing.assert_array_equal(got[1], want[1])
+    np.testing.assert_array_equal(got[2], want[2])
+
+def test_numba_kernels_match_numpy(monkeypatch):
+    numba_kernels = pytest.importorskip("airq_nyc._aqi_numba")
+    cols = _mixed_columns()
+    monkeypatch.setattr(ac, "_aqi_kernel", numba_kernels._aqi_kernel)
+    monkeypatch.setattr(ac, "_fused_final_aqi", numba_kernels._fused_final_aqi)
+    jit_subs = [aqi_vector(name, v) for name, v in zip(ac.POLLUTANTS, cols)]
+    jit_final = ac.final_aqi_vector(*cols)
+    monkeypatch.setattr(ac, "_aqi_kernel", None)
+    monkeypatch.setattr(ac, "_fused_final_aqi", None)
+    for name, v, (aqi, cat) in zip(ac.POLLUTANTS, cols, jit_subs):
+        want_aqi, want_cat = aqi_vector(name, v)
+        np.testing.assert_array_equal(aqi, want_aqi)
+        np.testing.assert_array_equal(cat, want_cat)
+    for got, want in zip(jit_final, ac.final_aqi_vector(*cols)):
+        np.testing.assert_array_equal(got, want)
+    # the gap and out-of-range values really went through the miss branch
+    assert np.isnan(jit_subs[0][0][3]) and np.isnan(jit_subs[2][0][4])
+
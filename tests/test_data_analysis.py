@@ -1,5 +1,12 @@
 import pandas as pd
-from airq_nyc.data_analysis import compute_aqi_from_pollutants, aggregate_trend
+import pytest
+from airq_nyc.data_analysis import (
+    compute_aqi_from_pollutants,
+    aggregate_trend,
+    prepare_compare,
+    aggregate_compare,
+    daily_ratio,
+)
 
 def test_compute_columns_present():
     df = pd.DataFrame({
@@ -26,3 +33,43 @@ def test_monthly_aggregate():
     m = aggregate_trend(comp, "ME")
     assert len(m) == 1
     assert "aqi_mean" in m.columns
+
+def test_compute_output_dtypes_and_missing_rows():
+    df = pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=2),
+        "pm25": [30.0, None],
+        "no2": [10.0, None],
+    })
+    out = compute_aqi_from_pollutants(df)
+    assert str(out["aqi"].dtype) == "Int16"
+    assert isinstance(out["dominant"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["category"].dtype, pd.CategoricalDtype)
+    assert out.loc[0, "dominant"] == "pm25"
+    assert pd.isna(out.loc[1, "aqi"]) and pd.isna(out.loc[1, "category"])
+
+def test_aggregate_compare_accepts_prepared_frame():
+    cmp = pd.DataFrame({
+        "date": pd.date_range("2024-01-30", periods=4, freq="D"),
+        "aqi_computed": [40.0, 50.0, 60.0, 70.0],
+        "aqi_epa": [40.0, 50.0, 30.0, 35.0],
+    })
+    prepped = prepare_compare(cmp)
+    pd.testing.assert_frame_equal(aggregate_compare(None, "ME", prepared=prepped),
+                                  aggregate_compare(cmp, "ME"))
+    pd.testing.assert_frame_equal(daily_ratio(None, prepared=prepped), daily_ratio(cmp))
+
+def test_monthly_aggregate_matches_resample_with_empty_months():
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-03", "2024-01-20", "2024-04-30", "2024-02-29"]),
+        "aqi": pd.array([10, None, 40, 20], dtype="Int16"),
+    })
+    m = aggregate_trend(df, "ME")
+    expected = df.set_index("date").resample("ME")["aqi"].mean().reset_index(name="aqi_mean")
+    pd.testing.assert_frame_equal(m, expected)
+    assert m["date"].dt.day.tolist() == [31, 29, 31, 30]   # March kept as an empty month
+
+def test_monthly_aggregate_keeps_resample_error_for_non_datetime_dates():
+    df = pd.DataFrame({"date": ["2024-01-01", "2024-02-01"], "aqi": [10.0, 20.0]})
+    with pytest.raises(TypeError, match="DatetimeIndex"):
+        aggregate_trend(df, "ME")
+
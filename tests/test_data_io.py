@@ -7,3 +7,11 @@ def test_reader_parses_date_and_numeric(tmp_path):
     df = read_pollutants_csv(f)
     assert pd.api.types.is_datetime64_any_dtype(df["date"])
     assert df["pm25"].dtype.kind in "fc"  # numeric
+
+def test_reader_handles_padded_fields_and_alt_date(tmp_path):
+    f = tmp_path / "padded.csv"
+    f.write_text("Day, pm25, o3\n2024/1/2, 20, \n2024/1/1, 10, 0.05\n")
+    df = read_pollutants_csv(f)
+    assert list(df["date"]) == list(pd.to_datetime(["2024-01-01", "2024-01-02"]))
+    assert df["pm25"].tolist() == [10.0, 20.0]
+    assert df["o3"].dtype.kind == "f"
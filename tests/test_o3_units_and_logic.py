@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
-from airq_nyc.data_io import read_pollutants_csv
-from airq_nyc.aqi_calculations import aqi_for_pollutant
+from airq_nyc.data_io import read_pollutants_csv, _choose_o3_conversion
+from airq_nyc.aqi_calculations import aqi_for_pollutant, aqi_vector, _CATEGORY_LIST
 
 def test_o3_ppb_auto_conversion(tmp_path):
     # O3 values ~ tens → should be interpreted as ppb and divided by 1000
@@ -18,3 +19,17 @@ def test_o3_one_hour_fallback():
     # Should be unhealthy or worse (AQI >= 151 is typical here)
     assert aqi >= 101
     assert isinstance(cat, str) and len(cat) > 0
+
+def test_o3_conversion_choice_by_p95():
+    assert _choose_o3_conversion(pd.Series([0.03, 0.05, None])) == "none"
+    assert _choose_o3_conversion(pd.Series([30.0, 50.0, 80.0])) == "ppb"
+    assert _choose_o3_conversion(pd.Series([500.0, 600.0, 700.0])) == "ugm3"
+    assert _choose_o3_conversion(pd.Series([None, None], dtype=float)) == "none"
+
+def test_o3_8hr_to_1hr_switch_at_0_200():
+    assert aqi_for_pollutant("o3", 0.200) == (300, "Very Unhealthy")      # last 8-hr band
+    assert aqi_for_pollutant("o3", 0.202)[1] == "Unhealthy"              # 1-hr band
+    aqi, cat = aqi_vector("o3", np.array([0.200, 0.202, 0.30]))
+    assert [(int(a), _CATEGORY_LIST[c]) for a, c in zip(aqi, cat)] == [
+        aqi_for_pollutant("o3", v) for v in (0.200, 0.202, 0.30)
+    ]